@@ -12,14 +12,31 @@ for agent workflows rather than simple API wrappers.
 import os
 import json
 import asyncio
+import functools
+import itertools
 import logging
-from typing import Optional, List, Dict, Any, Literal
-from datetime import datetime, timedelta
+import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Optional, List, Dict, Any, Literal, Callable, Iterator, Tuple, AsyncIterator
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from pydantic import BaseModel, Field, field_validator
+from urllib.parse import quote
+import aiohttp
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from fastmcp import FastMCP
 
+# Optional faster JSON encoding and decoding; the standard library is used without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Google API imports
+import httplib2
+import google_auth_httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
@@ -38,10 +55,35 @@ CHARACTER_LIMIT = 25000
 MAX_TASKS_PER_RESPONSE = 100
 MAX_LISTS_PER_RESPONSE = 50
 
+# Maximum number of requests Google accepts in one batch
+MAX_BATCH_SIZE = 100
+
+# Maximum number of API requests a tool fans out at once, to stay within per-user quota
+MAX_CONCURRENT_REQUESTS = 10
+
+# Read-through cache for the list calls behind search_tasks and get_task_summary
+CACHE_TTL = 30  # seconds
+CACHE_MAXSIZE = 128
+# Task lists change rarely, so they are kept for longer
+TASKLISTS_CACHE_TTL = 300  # seconds
+
+# Google Tasks REST API
+TASKS_API_BASE = 'https://tasks.googleapis.com/tasks/v1'
+
+# HTTP connection pool settings
+HTTP_POOL_LIMIT = 100
+HTTP_POOL_LIMIT_PER_HOST = 20
+HTTP_KEEPALIVE_TIMEOUT = 120  # seconds
+HTTP_DNS_CACHE_TTL = 300  # seconds
+HTTP_TIMEOUT = 30  # seconds
+
 # Token storage path
 TOKEN_PATH = os.path.expanduser('~/.google_tasks_mcp/token.json')
 CREDENTIALS_PATH = os.path.expanduser('~/.google_tasks_mcp/credentials.json')
 
+# Access tokens are refreshed once they are this close to expiring
+TOKEN_REFRESH_MARGIN = timedelta(seconds=60)
+
 # Logging configuration
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -69,30 +111,40 @@ class TaskPriority(str, Enum):
     LOW = "low"
     ALL = "all"
 
+# Model fields use plain string literals, which Pydantic validates faster than Enum types.
+# The enums above name the same values for comparisons in code.
+ResponseFormatName = Literal["json", "markdown", "concise", "detailed"]
+TaskStatusName = Literal["needsAction", "completed"]
+
+class BaseInput(BaseModel):
+    """Base model for tool inputs"""
+    # Inputs are read-only once validated, and unknown fields are dropped rather than checked
+    model_config = ConfigDict(extra='ignore', frozen=True)
+
 # --- Task List Models ---
 
-class CreateTaskListInput(BaseModel):
+class CreateTaskListInput(BaseInput):
     """Input model for creating a task list"""
     title: str = Field(..., description="Title of the new task list", min_length=1, max_length=200)
 
-class ListTaskListsInput(BaseModel):
+class ListTaskListsInput(BaseInput):
     """Input model for listing task lists"""
     max_results: int = Field(default=20, description="Maximum number of task lists to return (1-50)", ge=1, le=MAX_LISTS_PER_RESPONSE)
     page_token: Optional[str] = Field(None, description="Token for pagination from previous response")
-    response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN, description="Response format")
+    response_format: ResponseFormatName = Field(default="markdown", description="Response format")
 
-class UpdateTaskListInput(BaseModel):
+class UpdateTaskListInput(BaseInput):
     """Input model for updating a task list"""
     tasklist_id: str = Field(..., description="ID of the task list to update")
     title: str = Field(..., description="New title for the task list", min_length=1, max_length=200)
 
-class DeleteTaskListInput(BaseModel):
+class DeleteTaskListInput(BaseInput):
     """Input model for deleting a task list"""
     tasklist_id: str = Field(..., description="ID of the task list to delete")
 
 # --- Task Models ---
 
-class CreateTaskInput(BaseModel):
+class CreateTaskInput(BaseInput):
     """Input model for creating a task"""
     title: str = Field(..., description="Title of the task", min_length=1, max_length=500)
     notes: Optional[str] = Field(None, description="Additional notes/description for the task", max_length=8192)
@@ -110,7 +162,7 @@ class CreateTaskInput(BaseModel):
                 raise ValueError("Due date must be in ISO format (YYYY-MM-DD)")
         return v
 
-class ListTasksInput(BaseModel):
+class ListTasksInput(BaseInput):
     """Input model for listing tasks"""
     tasklist_id: Optional[str] = Field(default="@default", description="ID of task list (default: primary list)")
     max_results: int = Field(default=30, description="Maximum number of tasks to return (1-100)", ge=1, le=MAX_TASKS_PER_RESPONSE)
@@ -123,84 +175,99 @@ class ListTasksInput(BaseModel):
     completed_max: Optional[str] = Field(None, description="Maximum completion date (ISO format)")
     updated_min: Optional[str] = Field(None, description="Minimum last update date (ISO format)")
     page_token: Optional[str] = Field(None, description="Token for pagination from previous response")
-    response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN, description="Response format")
+    response_format: ResponseFormatName = Field(default="markdown", description="Response format")
 
-class UpdateTaskInput(BaseModel):
+class UpdateTaskInput(BaseInput):
     """Input model for updating a task"""
     task_id: str = Field(..., description="ID of the task to update")
     tasklist_id: Optional[str] = Field(default="@default", description="ID of the task list containing the task")
     title: Optional[str] = Field(None, description="New title for the task", min_length=1, max_length=500)
     notes: Optional[str] = Field(None, description="New notes/description for the task", max_length=8192)
-    status: Optional[TaskStatus] = Field(None, description="Task status (needsAction or completed)")
+    status: Optional[TaskStatusName] = Field(None, description="Task status (needsAction or completed)")
     due_date: Optional[str] = Field(None, description="New due date in ISO format (YYYY-MM-DD), or 'clear' to remove")
 
-class DeleteTaskInput(BaseModel):
+class DeleteTaskInput(BaseInput):
     """Input model for deleting a task"""
     task_id: str = Field(..., description="ID of the task to delete")
     tasklist_id: Optional[str] = Field(default="@default", description="ID of the task list containing the task")
 
-class MoveTaskInput(BaseModel):
+class MoveTaskInput(BaseInput):
     """Input model for moving a task"""
     task_id: str = Field(..., description="ID of the task to move")
     tasklist_id: Optional[str] = Field(default="@default", description="ID of the task list containing the task")
     parent_task_id: Optional[str] = Field(None, description="ID of new parent task (null to move to root)")
     previous_task_id: Optional[str] = Field(None, description="ID of task to position after")
 
-class ClearCompletedTasksInput(BaseModel):
+class ClearCompletedTasksInput(BaseInput):
     """Input model for clearing completed tasks"""
     tasklist_id: Optional[str] = Field(default="@default", description="ID of the task list to clear completed tasks from")
 
 # --- Workflow Models ---
 
-class QuickAddTaskInput(BaseModel):
+class QuickAddTaskInput(BaseInput):
     """Input model for quickly adding a task with smart parsing"""
     text: str = Field(..., description="Natural language task description (e.g., 'Buy milk tomorrow', 'Meeting with John at 3pm on Friday')")
     tasklist_id: Optional[str] = Field(default="@default", description="ID of task list to add to")
 
-class BulkCreateTasksInput(BaseModel):
+class QuickAddManyInput(BaseInput):
+    """Input model for quickly adding several tasks with smart parsing"""
+    texts: List[str] = Field(..., description="Natural language task descriptions (e.g., ['Buy milk tomorrow', 'Call mom next Friday'])", min_length=1, max_length=50)
+    tasklist_id: Optional[str] = Field(default="@default", description="ID of task list to add to")
+
+class BulkCreateTasksInput(BaseInput):
     """Input model for creating multiple tasks at once"""
     tasks: List[str] = Field(..., description="List of task titles to create", min_length=1, max_length=50)
     tasklist_id: Optional[str] = Field(default="@default", description="ID of task list to add tasks to")
     due_date: Optional[str] = Field(None, description="Common due date for all tasks (ISO format)")
 
-class SearchTasksInput(BaseModel):
+class SearchTasksInput(BaseInput):
     """Input model for searching tasks across all lists"""
     query: str = Field(..., description="Search query to match against task titles and notes", min_length=1)
     include_completed: bool = Field(default=False, description="Include completed tasks in search")
     max_results: int = Field(default=20, description="Maximum results to return", ge=1, le=50)
-    response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN, description="Response format")
+    due_min: Optional[str] = Field(None, description="Only search tasks due on or after this date (ISO format)")
+    due_max: Optional[str] = Field(None, description="Only search tasks due on or before this date (ISO format)")
+    updated_min: Optional[str] = Field(None, description="Only search tasks updated on or after this date (ISO format)")
+    response_format: ResponseFormatName = Field(default="markdown", description="Response format")
 
-class GetTaskSummaryInput(BaseModel):
+class GetTaskSummaryInput(BaseInput):
     """Input model for getting a summary of tasks"""
     time_range: Literal["today", "tomorrow", "week", "overdue", "all"] = Field(
         default="today",
         description="Time range for task summary"
     )
     include_completed: bool = Field(default=False, description="Include completed tasks in summary")
-    response_format: ResponseFormat = Field(default=ResponseFormat.CONCISE, description="Response format")
+    response_format: ResponseFormatName = Field(default="concise", description="Response format")
 
 # ==========================================
 # AUTHENTICATION HELPER
 # ==========================================
 
+# Parsed credentials, and the token JSON last read from or written to TOKEN_PATH
+_cached_creds: Optional[Credentials] = None
+_cached_token_json: Optional[str] = None
+
 class GoogleTasksAuth:
     """Handle Google OAuth 2.0 authentication"""
     
     @staticmethod
     def get_credentials() -> Optional[Credentials]:
-        """Get valid user credentials from storage or initiate OAuth flow"""
-        creds = None
-        
-        # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(TOKEN_PATH), exist_ok=True)
+        """Get valid user credentials from memory, storage, or by initiating the OAuth flow"""
+        global _cached_creds, _cached_token_json
+        creds = _cached_creds
         
-        # Load existing token
-        if os.path.exists(TOKEN_PATH):
-            try:
-                creds = Credentials.from_authorized_user_file(TOKEN_PATH, SCOPES)
-            except Exception as e:
-                logger.error(f"Error loading credentials: {e}")
-                creds = None
+        if creds is None:
+            # Create directory if it doesn't exist
+            os.makedirs(os.path.dirname(TOKEN_PATH), exist_ok=True)
+            
+            # Load existing token
+            if os.path.exists(TOKEN_PATH):
+                try:
+                    creds = Credentials.from_authorized_user_file(TOKEN_PATH, SCOPES)
+                    _cached_token_json = creds.to_json()
+                except Exception as e:
+                    logger.error(f"Error loading credentials: {e}")
+                    creds = None
         
         # Refresh or get new credentials
         if not creds or not creds.valid:
@@ -225,53 +292,375 @@ class GoogleTasksAuth:
                 creds = flow.run_local_server(port=0)
             
             # Save credentials for next run
-            with open(TOKEN_PATH, 'w') as token:
-                token.write(creds.to_json())
+            GoogleTasksAuth.save_credentials(creds)
         
+        _cached_creds = creds
         return creds
+    
+    @staticmethod
+    def save_credentials(creds: Credentials) -> None:
+        """Write credentials to TOKEN_PATH, skipping the write if the token hasn't changed"""
+        global _cached_token_json
+        token_json = creds.to_json()
+        if token_json == _cached_token_json:
+            return
+        
+        with open(TOKEN_PATH, 'w') as token:
+            token.write(token_json)
+        _cached_token_json = token_json
+
+# In-flight token refreshes, keyed by token path, so concurrent requests share one refresh
+_refresh_inflight: Dict[str, asyncio.Task] = {}
+
+# ==========================================
+# HTTP SESSION
+# ==========================================
+
+# Shared aiohttp session, created lazily inside the running event loop
+_http_session: Optional[aiohttp.ClientSession] = None
+
+def _new_http_session() -> aiohttp.ClientSession:
+    """Create an HTTP session with the tuned connection pool"""
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=HTTP_POOL_LIMIT,
+            limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+            keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=HTTP_DNS_CACHE_TTL
+        ),
+        timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT)
+    )
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Get the shared HTTP session, creating it on first use"""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = _new_http_session()
+    return _http_session
+
+async def close_http_session():
+    """Close the shared HTTP session, if one is open"""
+    global _http_session
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+    _http_session = None
+
+# Decoder for API response bodies
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+def _path_id(value: str) -> str:
+    """Escape a task or task list ID for use in a URL path"""
+    return quote(value, safe='@')
+
+def _query_value(value: Any) -> Any:
+    """Convert a query parameter to a form aiohttp accepts"""
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return value
+
+def _http_error(resp: aiohttp.ClientResponse, content: bytes) -> HttpError:
+    """Wrap an error response in the googleapiclient HttpError type"""
+    info = httplib2.Response({'status': resp.status})
+    info.reason = resp.reason
+    return HttpError(info, content, uri=str(resp.url))
 
 # ==========================================
 # GOOGLE TASKS CLIENT
 # ==========================================
 
+# list_tasks date filters: keyword -> (API parameter, RFC 3339 template for a YYYY-MM-DD date)
+_DATE_PARAM_MAP = {
+    'due_min': ('dueMin', '{}T00:00:00.000Z'),
+    'due_max': ('dueMax', '{}T23:59:59.999Z'),
+    'completed_min': ('completedMin', '{}T00:00:00.000Z'),
+    'completed_max': ('completedMax', '{}T23:59:59.999Z'),
+    'updated_min': ('updatedMin', '{}T00:00:00.000Z'),
+}
+
+def _task_body(title: str, notes: Optional[str] = None, due: Optional[str] = None) -> Dict[str, Any]:
+    """Build the request body for inserting a task"""
+    body = {'title': title}
+    if notes:
+        body['notes'] = notes
+    if due:
+        # Convert date to RFC 3339 format
+        body['due'] = f"{due}T00:00:00.000Z"
+    return body
+
+class _TTLCache:
+    """Small LRU cache whose entries expire CACHE_TTL seconds after being stored"""
+    
+    def __init__(self, ttl: float = CACHE_TTL, maxsize: int = CACHE_MAXSIZE):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict = OrderedDict()
+        # Bumped by every invalidation, so a fetch that started before one can be left uncached
+        self.generation = 0
+    
+    def get(self, key: Tuple) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+    
+    def set(self, key: Tuple, value: Dict[str, Any], generation: Optional[int] = None):
+        """Store `value`, unless `generation` is given and the cache was invalidated since"""
+        if generation is not None and generation != self.generation:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def invalidate(self, predicate: Callable[[Tuple], bool]):
+        self.generation += 1
+        for key in [key for key in self._entries if predicate(key)]:
+            del self._entries[key]
+    
+    def clear(self):
+        self.generation += 1
+        self._entries.clear()
+
+# update_task fields copied onto the task as-is when given a non-empty value
+_UPDATABLE_FIELDS = ('title', 'notes', 'status')
+
 class GoogleTasksClient:
     """Client for interacting with Google Tasks API"""
     
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        # An injected session is owned by the caller; otherwise the shared module session is used
+        self.session = session
+        self._owns_session = False
+        self.creds = None
         self.service = None
+        self._tasklists = None
+        self._tasks = None
+        # httplib2.Http is not thread-safe, so worker threads take turns with the service's
+        # connection, building the service and refreshing the credentials under this lock
+        self._service_lock = threading.RLock()
+        self._cache = _TTLCache()
+        self._tasklists_cache = _TTLCache(ttl=TASKLISTS_CACHE_TTL, maxsize=4)
+        self._tasklists_lock = asyncio.Lock()
         self._initialize()
     
+    async def __aenter__(self) -> "GoogleTasksClient":
+        """Send requests over a dedicated HTTP session until the block exits"""
+        if self.session is None:
+            self.session = _new_http_session()
+            self._owns_session = True
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        if self._owns_session:
+            await self.session.close()
+            self.session = None
+            self._owns_session = False
+    
     def _initialize(self):
-        """Initialize the Google Tasks service"""
+        """Load the credentials used to authorize API requests"""
         try:
-            creds = GoogleTasksAuth.get_credentials()
-            if creds:
-                self.service = build('tasks', 'v1', credentials=creds)
-            else:
+            self.creds = GoogleTasksAuth.get_credentials()
+            if not self.creds:
                 raise Exception("Failed to obtain credentials")
         except Exception as e:
             logger.error(f"Failed to initialize Google Tasks client: {e}")
             raise
     
+    def _get_service(self):
+        """Build the googleapiclient service used as a fallback transport"""
+        with self._service_lock:
+            if self.service is None:
+                # Reuse one authorized connection and the discovery document bundled with the library
+                http = google_auth_httplib2.AuthorizedHttp(self.creds, http=httplib2.Http(timeout=HTTP_TIMEOUT))
+                self.service = build('tasks', 'v1', http=http, cache_discovery=False, static_discovery=True)
+                # Resource objects are rebuilt on every service.tasklists()/tasks() call, so keep one of each
+                self._tasklists = self.service.tasklists()
+                self._tasks = self.service.tasks()
+            return self.service
+    
+    def _execute_fallback(self, fallback: Callable[[], Any]) -> Dict[str, Any]:
+        """Execute a googleapiclient request (blocking; run in a worker thread)"""
+        with self._service_lock:
+            self._get_service()
+            try:
+                return fallback().execute()
+            finally:
+                # The transport refreshes the token itself on a 401, so persist any new token
+                GoogleTasksAuth.save_credentials(self.creds)
+    
+    def _needs_refresh(self) -> bool:
+        """Check whether the access token is missing or about to expire"""
+        if not self.creds.token:
+            return True
+        if self.creds.expiry is None:
+            return False
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return self.creds.expiry - now <= TOKEN_REFRESH_MARGIN
+    
+    def _refresh_credentials(self, rejected_token: Optional[str] = None):
+        """Refresh the access token and persist it (blocking; run in a worker thread)"""
+        with self._service_lock:
+            # A batch or fallback request may have refreshed the token while this call waited
+            if not self._needs_refresh() and (rejected_token is None or self.creds.token != rejected_token):
+                return
+            self.creds.refresh(Request())
+            GoogleTasksAuth.save_credentials(self.creds)
+    
+    async def _ensure_valid_creds(self, rejected_token: Optional[str] = None):
+        """Refresh the access token if needed, sharing a single refresh between concurrent callers
+        
+        A `rejected_token` that the API answered with 401 is refreshed even if it hasn't expired.
+        """
+        if not self._needs_refresh() and (rejected_token is None or self.creds.token != rejected_token):
+            return
+        
+        refresh = _refresh_inflight.get(TOKEN_PATH)
+        if refresh is None:
+            refresh = asyncio.create_task(asyncio.to_thread(self._refresh_credentials, rejected_token))
+            _refresh_inflight[TOKEN_PATH] = refresh
+            refresh.add_done_callback(lambda _: _refresh_inflight.pop(TOKEN_PATH, None))
+        
+        # Shield the shared refresh so one cancelled caller doesn't cancel it for the others
+        await asyncio.shield(refresh)
+    
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_body: Optional[Dict[str, Any]] = None,
+        fallback: Optional[Callable[[], Any]] = None
+    ) -> Dict[str, Any]:
+        """Send a request to the Tasks REST API without blocking the event loop.
+        
+        If the connection to Google cannot be established, the equivalent
+        googleapiclient request returned by `fallback` is executed in a worker
+        thread instead. A 401 forces one token refresh and one retry.
+        """
+        await self._ensure_valid_creds()
+        
+        query = {key: _query_value(value) for key, value in (params or {}).items() if value is not None}
+        
+        for attempt in (1, 2):
+            token = self.creds.token
+            try:
+                async with (self.session or get_http_session()).request(
+                    method,
+                    f"{TASKS_API_BASE}{path}",
+                    params=query,
+                    json=json_body,
+                    headers={'Authorization': f"Bearer {token}"}
+                ) as resp:
+                    # A token revoked early, or clock skew beyond TOKEN_REFRESH_MARGIN, is only
+                    # noticed here; refresh it and retry once, as AuthorizedHttp does
+                    if resp.status == 401 and attempt == 1:
+                        logger.warning(f"Access token rejected for {method} {path}, refreshing it")
+                    elif resp.status >= 400:
+                        raise _http_error(resp, await resp.read())
+                    elif resp.status == 204:
+                        return {}
+                    else:
+                        # Decode the raw bytes directly, skipping aiohttp's intermediate str copy of the body
+                        return _json_loads(await resp.read())
+            except aiohttp.ClientConnectorError as e:
+                if fallback is None:
+                    raise
+                logger.warning(f"Falling back to googleapiclient for {method} {path}: {e}")
+                return await asyncio.to_thread(self._execute_fallback, fallback)
+            await self._ensure_valid_creds(rejected_token=token)
+    
+    # --- Cached Reads ---
+    
+    async def cached_list_tasklists(self, max_results: int = 20) -> Dict[str, Any]:
+        """List task lists, reusing a result fetched within the last TASKLISTS_CACHE_TTL seconds"""
+        key = ('tasklists', max_results)
+        # Concurrent callers wait for a single fetch instead of each starting their own
+        async with self._tasklists_lock:
+            result = self._tasklists_cache.get(key)
+            if result is None:
+                # A create/update/delete during the fetch invalidates the cache, and then the
+                # listing may predate it, so it is returned but not stored
+                generation = self._tasklists_cache.generation
+                result = await self.list_tasklists(max_results=max_results)
+                self._tasklists_cache.set(key, result, generation)
+        return result
+    
+    async def cached_list_tasks(self, tasklist_id: str = "@default", **kwargs) -> Dict[str, Any]:
+        """List tasks, reusing a result fetched within the last CACHE_TTL seconds
+        
+        Callers must not modify the returned tasks, since they are shared with later calls.
+        """
+        key = ('tasks', tasklist_id, tuple(sorted(kwargs.items())))
+        result = self._cache.get(key)
+        if result is None:
+            # As with task lists, a page fetched across a task change is returned but not stored
+            generation = self._cache.generation
+            result = await self.list_tasks(tasklist_id, **kwargs)
+            self._cache.set(key, result, generation)
+        return result
+    
+    async def iter_task_pages(self, tasklist_id: str = "@default", **kwargs) -> AsyncIterator[Dict[str, Any]]:
+        """Yield successive cached_list_tasks pages, fetching each one only when the caller asks for it"""
+        page_token = None
+        while True:
+            result = await self.cached_list_tasks(tasklist_id, page_token=page_token, **kwargs)
+            yield result
+            page_token = result.get('nextPageToken')
+            if not page_token:
+                return
+    
+    def _invalidate_tasks(self, tasklist_id: str):
+        """Drop cached task pages that a change to `tasklist_id` may have made stale"""
+        if tasklist_id == "@default":
+            # '@default' is an alias, so any cached list may be the one that changed
+            self._cache.invalidate(lambda key: key[0] == 'tasks')
+        else:
+            self._cache.invalidate(lambda key: key[0] == 'tasks' and key[1] in (tasklist_id, "@default"))
+    
+    def _invalidate_tasklists(self):
+        """Drop cached task list listings"""
+        self._tasklists_cache.clear()
+    
     # --- Task List Operations ---
     
-    async def create_tasklist(self, title: str) -> Dict[str, Any]:
-        """Create a new task list"""
+    async def create_tasklist(self, title: str, fields: Optional[str] = None) -> Dict[str, Any]:
+        """Create a new task list, optionally returning only the `fields` partial response"""
         try:
             body = {'title': title}
-            result = self.service.tasklists().insert(body=body).execute()
+            result = await self._request(
+                'POST', '/users/@me/lists',
+                params={'fields': fields},
+                json_body=body,
+                fallback=lambda: self._tasklists.insert(body=body, fields=fields)
+            )
+            self._invalidate_tasklists()
             return result
         except HttpError as e:
             logger.error(f"Error creating task list: {e}")
             raise
     
-    async def list_tasklists(self, max_results: int = 20, page_token: Optional[str] = None) -> Dict[str, Any]:
-        """List task lists"""
+    async def list_tasklists(
+        self,
+        max_results: int = 20,
+        page_token: Optional[str] = None,
+        fields: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """List task lists, optionally returning only the `fields` partial response"""
         try:
-            result = self.service.tasklists().list(
-                maxResults=max_results,
-                pageToken=page_token
-            ).execute()
+            result = await self._request(
+                'GET', '/users/@me/lists',
+                params={'maxResults': max_results, 'pageToken': page_token, 'fields': fields},
+                fallback=lambda: self._tasklists.list(
+                    maxResults=max_results,
+                    pageToken=page_token,
+                    fields=fields
+                )
+            )
             return result
         except HttpError as e:
             logger.error(f"Error listing task lists: {e}")
@@ -280,12 +669,21 @@ class GoogleTasksClient:
     async def update_tasklist(self, tasklist_id: str, title: str) -> Dict[str, Any]:
         """Update a task list"""
         try:
-            tasklist = self.service.tasklists().get(tasklist=tasklist_id).execute()
+            path = f"/users/@me/lists/{_path_id(tasklist_id)}"
+            tasklist = await self._request(
+                'GET', path,
+                fallback=lambda: self._tasklists.get(tasklist=tasklist_id)
+            )
             tasklist['title'] = title
-            result = self.service.tasklists().update(
-                tasklist=tasklist_id,
-                body=tasklist
-            ).execute()
+            result = await self._request(
+                'PUT', path,
+                json_body=tasklist,
+                fallback=lambda: self._tasklists.update(
+                    tasklist=tasklist_id,
+                    body=tasklist
+                )
+            )
+            self._invalidate_tasklists()
             return result
         except HttpError as e:
             logger.error(f"Error updating task list: {e}")
@@ -294,7 +692,12 @@ class GoogleTasksClient:
     async def delete_tasklist(self, tasklist_id: str) -> bool:
         """Delete a task list"""
         try:
-            self.service.tasklists().delete(tasklist=tasklist_id).execute()
+            await self._request(
+                'DELETE', f"/users/@me/lists/{_path_id(tasklist_id)}",
+                fallback=lambda: self._tasklists.delete(tasklist=tasklist_id)
+            )
+            self._invalidate_tasklists()
+            self._invalidate_tasks(tasklist_id)
             return True
         except HttpError as e:
             logger.error(f"Error deleting task list: {e}")
@@ -309,28 +712,81 @@ class GoogleTasksClient:
         notes: Optional[str] = None,
         due: Optional[str] = None,
         parent: Optional[str] = None,
-        previous: Optional[str] = None
+        previous: Optional[str] = None,
+        fields: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Create a new task"""
+        """Create a new task, optionally returning only the `fields` partial response"""
         try:
-            body = {'title': title}
-            if notes:
-                body['notes'] = notes
-            if due:
-                # Convert date to RFC 3339 format
-                body['due'] = f"{due}T00:00:00.000Z"
-            
-            result = self.service.tasks().insert(
-                tasklist=tasklist_id,
-                body=body,
-                parent=parent,
-                previous=previous
-            ).execute()
+            body = _task_body(title, notes, due)
+            result = await self._request(
+                'POST', f"/lists/{_path_id(tasklist_id)}/tasks",
+                params={'parent': parent, 'previous': previous, 'fields': fields},
+                json_body=body,
+                fallback=lambda: self._tasks.insert(
+                    tasklist=tasklist_id,
+                    body=body,
+                    parent=parent,
+                    previous=previous,
+                    fields=fields
+                )
+            )
+            self._invalidate_tasks(tasklist_id)
             return result
         except HttpError as e:
             logger.error(f"Error creating task: {e}")
             raise
     
+    async def batch_create_tasks(
+        self,
+        tasks: List[Tuple[str, Optional[str]]],
+        tasklist_id: str = "@default"
+    ) -> Tuple[List[Dict[str, Any]], List[Tuple[str, Exception]]]:
+        """Create (title, due date) pairs using batch requests of up to MAX_BATCH_SIZE inserts
+        
+        Returns the created tasks and a (title, error) pair for every insert that failed.
+        """
+        await self._ensure_valid_creds()
+        
+        created = []
+        failed = []
+        for start in range(0, len(tasks), MAX_BATCH_SIZE):
+            chunk = tasks[start:start + MAX_BATCH_SIZE]
+            try:
+                await asyncio.to_thread(self._execute_insert_batch, chunk, tasklist_id, created, failed)
+            except Exception as e:
+                logger.error(f"Error creating tasks in batch: {e}")
+                failed.extend((title, e) for title, _ in chunk)
+        self._invalidate_tasks(tasklist_id)
+        return created, failed
+    
+    def _execute_insert_batch(
+        self,
+        chunk: List[Tuple[str, Optional[str]]],
+        tasklist_id: str,
+        created: List[Dict[str, Any]],
+        failed: List[Tuple[str, Exception]]
+    ):
+        """Send one batch of task inserts (blocking; run in a worker thread)"""
+        def on_response(request_id, response, exception):
+            if exception is not None:
+                failed.append((chunk[int(request_id)][0], exception))
+            else:
+                created.append(response)
+        
+        with self._service_lock:
+            service = self._get_service()
+            batch = service.new_batch_http_request(callback=on_response)
+            for i, (title, due) in enumerate(chunk):
+                batch.add(
+                    self._tasks.insert(tasklist=tasklist_id, body=_task_body(title, due=due)),
+                    request_id=str(i)
+                )
+            try:
+                batch.execute()
+            finally:
+                # The batch refreshes the token itself on a 401, so persist any new token
+                GoogleTasksAuth.save_credentials(self.creds)
+    
     async def list_tasks(
         self,
         tasklist_id: str = "@default",
@@ -340,7 +796,6 @@ class GoogleTasksClient:
         try:
             # Build query parameters
             params = {
-                'tasklist': tasklist_id,
                 'maxResults': kwargs.get('max_results', 30),
                 'showCompleted': kwargs.get('show_completed', False),
                 'showDeleted': kwargs.get('show_deleted', False),
@@ -348,20 +803,22 @@ class GoogleTasksClient:
             }
             
             # Add optional date filters
-            if kwargs.get('due_min'):
-                params['dueMin'] = f"{kwargs['due_min']}T00:00:00.000Z"
-            if kwargs.get('due_max'):
-                params['dueMax'] = f"{kwargs['due_max']}T23:59:59.999Z"
-            if kwargs.get('completed_min'):
-                params['completedMin'] = f"{kwargs['completed_min']}T00:00:00.000Z"
-            if kwargs.get('completed_max'):
-                params['completedMax'] = f"{kwargs['completed_max']}T23:59:59.999Z"
-            if kwargs.get('updated_min'):
-                params['updatedMin'] = f"{kwargs['updated_min']}T00:00:00.000Z"
+            params.update({
+                api_key: template.format(kwargs[key])
+                for key, (api_key, template) in _DATE_PARAM_MAP.items()
+                if kwargs.get(key)
+            })
             if kwargs.get('page_token'):
                 params['pageToken'] = kwargs['page_token']
+            # Partial response mask, e.g. 'items(id,title),nextPageToken'
+            if kwargs.get('fields'):
+                params['fields'] = kwargs['fields']
             
-            result = self.service.tasks().list(**params).execute()
+            result = await self._request(
+                'GET', f"/lists/{_path_id(tasklist_id)}/tasks",
+                params=params,
+                fallback=lambda: self._tasks.list(tasklist=tasklist_id, **params)
+            )
             return result
         except HttpError as e:
             logger.error(f"Error listing tasks: {e}")
@@ -375,27 +832,35 @@ class GoogleTasksClient:
     ) -> Dict[str, Any]:
         """Update a task"""
         try:
+            path = f"/lists/{_path_id(tasklist_id)}/tasks/{_path_id(task_id)}"
+            
             # Get current task
-            task = self.service.tasks().get(tasklist=tasklist_id, task=task_id).execute()
+            task = await self._request(
+                'GET', path,
+                fallback=lambda: self._tasks.get(tasklist=tasklist_id, task=task_id)
+            )
             
             # Apply updates
-            if 'title' in updates and updates['title']:
-                task['title'] = updates['title']
-            if 'notes' in updates and updates['notes']:
-                task['notes'] = updates['notes']
-            if 'status' in updates and updates['status']:
-                task['status'] = updates['status']
-            if 'due_date' in updates:
-                if updates['due_date'] == 'clear':
-                    task.pop('due', None)
-                elif updates['due_date']:
-                    task['due'] = f"{updates['due_date']}T00:00:00.000Z"
+            for field in _UPDATABLE_FIELDS:
+                value = updates.get(field)
+                if value:
+                    task[field] = value
+            due_date = updates.get('due_date')
+            if due_date == 'clear':
+                task.pop('due', None)
+            elif due_date:
+                task['due'] = f"{due_date}T00:00:00.000Z"
             
-            result = self.service.tasks().update(
-                tasklist=tasklist_id,
-                task=task_id,
-                body=task
-            ).execute()
+            result = await self._request(
+                'PUT', path,
+                json_body=task,
+                fallback=lambda: self._tasks.update(
+                    tasklist=tasklist_id,
+                    task=task_id,
+                    body=task
+                )
+            )
+            self._invalidate_tasks(tasklist_id)
             return result
         except HttpError as e:
             logger.error(f"Error updating task: {e}")
@@ -404,7 +869,11 @@ class GoogleTasksClient:
     async def delete_task(self, task_id: str, tasklist_id: str = "@default") -> bool:
         """Delete a task"""
         try:
-            self.service.tasks().delete(tasklist=tasklist_id, task=task_id).execute()
+            await self._request(
+                'DELETE', f"/lists/{_path_id(tasklist_id)}/tasks/{_path_id(task_id)}",
+                fallback=lambda: self._tasks.delete(tasklist=tasklist_id, task=task_id)
+            )
+            self._invalidate_tasks(tasklist_id)
             return True
         except HttpError as e:
             logger.error(f"Error deleting task: {e}")
@@ -419,12 +888,17 @@ class GoogleTasksClient:
     ) -> Dict[str, Any]:
         """Move a task to a new position"""
         try:
-            result = self.service.tasks().move(
-                tasklist=tasklist_id,
-                task=task_id,
-                parent=parent,
-                previous=previous
-            ).execute()
+            result = await self._request(
+                'POST', f"/lists/{_path_id(tasklist_id)}/tasks/{_path_id(task_id)}/move",
+                params={'parent': parent, 'previous': previous},
+                fallback=lambda: self._tasks.move(
+                    tasklist=tasklist_id,
+                    task=task_id,
+                    parent=parent,
+                    previous=previous
+                )
+            )
+            self._invalidate_tasks(tasklist_id)
             return result
         except HttpError as e:
             logger.error(f"Error moving task: {e}")
@@ -433,7 +907,11 @@ class GoogleTasksClient:
     async def clear_completed(self, tasklist_id: str = "@default") -> bool:
         """Clear all completed tasks from a list"""
         try:
-            self.service.tasks().clear(tasklist=tasklist_id).execute()
+            await self._request(
+                'POST', f"/lists/{_path_id(tasklist_id)}/clear",
+                fallback=lambda: self._tasks.clear(tasklist=tasklist_id)
+            )
+            self._invalidate_tasks(tasklist_id)
             return True
         except HttpError as e:
             logger.error(f"Error clearing completed tasks: {e}")
@@ -443,14 +921,45 @@ class GoogleTasksClient:
 # RESPONSE FORMATTERS
 # ==========================================
 
+# Emoji shown for each task status
+_STATUS_EMOJI = {"completed": "✅", "needsAction": "⏳"}
+_status_emoji = _STATUS_EMOJI.get
+
+# Markdown layouts for format_task; the notes and due blocks are empty when the field is unset
+_TMPL_STANDARD = "### {emoji} {title}\n{notes_block}{due_block}"
+_TMPL_DETAILED = "### {emoji} {title}\n{notes_block}{due_block}**Status:** {status}\n**ID:** {id}\n"
+
+# Formatted tasks keyed by (id, etag, format); the etag changes whenever the task does
+_FORMATTED_TASK_CACHE_SIZE = 4096
+_formatted_tasks: OrderedDict = OrderedDict()
+
+def _dumps_pretty(obj: Any) -> str:
+    """Serialize an API payload as indented JSON"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+@functools.lru_cache(maxsize=1024)
+def _format_due(due: str) -> str:
+    """Format an RFC 3339 due timestamp as YYYY-MM-DD"""
+    # Google returns due dates as 'YYYY-MM-DDT00:00:00.000Z', so the date is the prefix
+    if len(due) >= 10 and due[4] == '-' and due[7] == '-':
+        return due[:10]
+    try:
+        return datetime.fromisoformat(due.replace('Z', '+00:00')).strftime('%Y-%m-%d')
+    except ValueError:
+        return due
+
 class ResponseFormatter:
     """Format API responses for different output types"""
     
     @staticmethod
     def format_task(task: Dict[str, Any], format_type: ResponseFormat) -> str:
         """Format a single task"""
+        # Callers rendering several tasks must serialize JSON for the whole batch
+        # (e.g. via format_multiple_tasks) instead of calling this per task.
         if format_type == ResponseFormat.JSON:
-            return json.dumps(task, indent=2)
+            return _dumps_pretty(task)
         
         # Extract key fields
         title = task.get('title', 'Untitled')
@@ -458,44 +967,55 @@ class ResponseFormatter:
         status = task.get('status', 'needsAction')
         due = task.get('due', '')
         
-        # Parse due date if present
-        due_str = ""
-        if due:
-            try:
-                due_date = datetime.fromisoformat(due.replace('Z', '+00:00'))
-                due_str = due_date.strftime('%Y-%m-%d')
-            except:
-                due_str = due
+        due_str = _format_due(due) if due else ""
+        status_emoji = _status_emoji(status, "⏳")
         
         if format_type == ResponseFormat.CONCISE:
-            status_emoji = "✅" if status == "completed" else "⏳"
             due_part = f" 📅 {due_str}" if due_str else ""
             return f"{status_emoji} {title}{due_part}"
         
         # Markdown format (default and detailed)
-        status_emoji = "✅" if status == "completed" else "⏳"
-        result = f"### {status_emoji} {title}\n"
-        
         if format_type == ResponseFormat.DETAILED:
-            if notes:
-                result += f"**Notes:** {notes}\n"
-            if due_str:
-                result += f"**Due:** {due_str}\n"
-            result += f"**Status:** {status}\n"
-            result += f"**ID:** {task.get('id', 'N/A')}\n"
-        else:  # Standard markdown
-            if notes:
-                result += f"> {notes}\n"
-            if due_str:
-                result += f"📅 **Due:** {due_str}\n"
+            return _TMPL_DETAILED.format(
+                emoji=status_emoji,
+                title=title,
+                notes_block=f"**Notes:** {notes}\n" if notes else "",
+                due_block=f"**Due:** {due_str}\n" if due_str else "",
+                status=status,
+                id=task.get('id', 'N/A')
+            )
         
-        return result
+        # Standard markdown
+        return _TMPL_STANDARD.format(
+            emoji=status_emoji,
+            title=title,
+            notes_block=f"> {notes}\n" if notes else "",
+            due_block=f"📅 **Due:** {due_str}\n" if due_str else ""
+        )
+    
+    @staticmethod
+    def format_task_cached(task: Dict[str, Any], format_type: ResponseFormat) -> str:
+        """Format a single task, reusing the output for a task seen before with the same etag"""
+        etag = task.get('etag')
+        if etag is None:
+            return ResponseFormatter.format_task(task, format_type)
+        
+        key = (task.get('id'), etag, format_type)
+        formatted = _formatted_tasks.get(key)
+        if formatted is None:
+            formatted = ResponseFormatter.format_task(task, format_type)
+            _formatted_tasks[key] = formatted
+            if len(_formatted_tasks) > _FORMATTED_TASK_CACHE_SIZE:
+                _formatted_tasks.popitem(last=False)
+        else:
+            _formatted_tasks.move_to_end(key)
+        return formatted
     
     @staticmethod
     def format_task_list(tasklist: Dict[str, Any], format_type: ResponseFormat) -> str:
         """Format a task list"""
         if format_type == ResponseFormat.JSON:
-            return json.dumps(tasklist, indent=2)
+            return _dumps_pretty(tasklist)
         
         title = tasklist.get('title', 'Untitled')
         list_id = tasklist.get('id', 'N/A')
@@ -514,41 +1034,89 @@ class ResponseFormatter:
         return result
     
     @staticmethod
-    def format_multiple_tasks(tasks: List[Dict[str, Any]], format_type: ResponseFormat, title: str = "Tasks") -> str:
-        """Format multiple tasks"""
+    def iter_format_multiple_tasks(
+        tasks: List[Dict[str, Any]],
+        format_type: ResponseFormat,
+        title: str = "Tasks"
+    ) -> Iterator[str]:
+        """Format multiple tasks, yielding the output in pieces"""
         if not tasks:
-            return "No tasks found."
+            yield "No tasks found."
+            return
         
         if format_type == ResponseFormat.JSON:
-            return json.dumps(tasks, indent=2)
+            yield _dumps_pretty(tasks)
+            return
+        
+        # Output is cut to this length if it would exceed CHARACTER_LIMIT. Pieces past the
+        # cut point are held back until it is known whether the output needs truncating.
+        cut_len = CHARACTER_LIMIT - 100
+        emitted_len = 0
+        held = []
+        held_len = 0
+        
+        for piece in ResponseFormatter._iter_task_pieces(tasks, format_type, title):
+            if not held and emitted_len + len(piece) <= cut_len:
+                emitted_len += len(piece)
+                yield piece
+                continue
+            
+            held.append(piece)
+            held_len += len(piece)
+            
+            # Truncate if too long, without formatting the tasks that would be cut anyway
+            if emitted_len + held_len > CHARACTER_LIMIT:
+                yield "".join(held)[:cut_len - emitted_len]
+                yield "\n\n... (truncated due to length)"
+                return
         
-        result = f"# {title}\n\n"
+        yield from held
+    
+    @staticmethod
+    def _iter_task_pieces(tasks: List[Dict[str, Any]], format_type: ResponseFormat, title: str) -> Iterator[str]:
+        """Yield the heading, separators and formatted tasks of a markdown task listing"""
+        yield f"# {title}\n\n"
         
         if format_type == ResponseFormat.CONCISE:
             for task in tasks:
-                result += ResponseFormatter.format_task(task, ResponseFormat.CONCISE) + "\n"
+                yield ResponseFormatter.format_task(task, ResponseFormat.CONCISE)
+                yield "\n"
         else:
-            for i, task in enumerate(tasks, 1):
-                if i > 1:
-                    result += "\n---\n\n"
-                result += ResponseFormatter.format_task(task, format_type)
-        
-        # Truncate if too long
-        if len(result) > CHARACTER_LIMIT:
-            result = result[:CHARACTER_LIMIT - 100] + "\n\n... (truncated due to length)"
-        
-        return result
+            for i, task in enumerate(tasks):
+                if i > 0:
+                    yield "\n---\n\n"
+                yield ResponseFormatter.format_task(task, format_type)
+    
+    @staticmethod
+    def format_multiple_tasks(tasks: List[Dict[str, Any]], format_type: ResponseFormat, title: str = "Tasks") -> str:
+        """Format multiple tasks"""
+        return "".join(ResponseFormatter.iter_format_multiple_tasks(tasks, format_type, title))
 
 # ==========================================
 # MCP SERVER IMPLEMENTATION
 # ==========================================
 
+@asynccontextmanager
+async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
+    """Close the shared HTTP session when the server shuts down"""
+    try:
+        yield {}
+    finally:
+        await close_http_session()
+
 # Initialize MCP server
-mcp = FastMCP("google-tasks-mcp", version="1.0.0")
+mcp = FastMCP("google-tasks-mcp", version="1.0.0", lifespan=server_lifespan)
 mcp.description = "Comprehensive Google Tasks management with workflow-oriented tools"
 
-# Initialize Google Tasks client
-tasks_client = GoogleTasksClient()
+# Google Tasks client, created on first use so importing this module doesn't trigger authentication
+tasks_client: Optional[GoogleTasksClient] = None
+
+def get_client() -> GoogleTasksClient:
+    """Get the shared Google Tasks client, authenticating on first call"""
+    global tasks_client
+    if tasks_client is None:
+        tasks_client = GoogleTasksClient()
+    return tasks_client
 
 # ==========================================
 # TASK LIST TOOLS
@@ -565,7 +1133,7 @@ tasks_client = GoogleTasksClient()
 async def create_task_list(input: CreateTaskListInput) -> str:
     """Create a new task list"""
     try:
-        result = await tasks_client.create_tasklist(input.title)
+        result = await get_client().create_tasklist(input.title)
         return ResponseFormatter.format_task_list(result, ResponseFormat.MARKDOWN)
     except Exception as e:
         return f"Error creating task list: {str(e)}. Please check your authentication and try again."
@@ -581,7 +1149,7 @@ async def create_task_list(input: CreateTaskListInput) -> str:
 async def list_task_lists(input: ListTaskListsInput) -> str:
     """List all task lists"""
     try:
-        result = await tasks_client.list_tasklists(
+        result = await get_client().list_tasklists(
             max_results=input.max_results,
             page_token=input.page_token
         )
@@ -591,17 +1159,17 @@ async def list_task_lists(input: ListTaskListsInput) -> str:
             return "No task lists found."
         
         if input.response_format == ResponseFormat.JSON:
-            return json.dumps(result, indent=2)
+            return _dumps_pretty(result)
         
-        output = "# Task Lists\n\n"
+        parts = ["# Task Lists\n\n"]
         for task_list in lists:
-            output += ResponseFormatter.format_task_list(task_list, input.response_format)
-            output += "\n"
+            parts.append(ResponseFormatter.format_task_list(task_list, input.response_format))
+            parts.append("\n")
         
         if result.get('nextPageToken'):
-            output += f"\n**More results available.** Use page_token: `{result['nextPageToken']}` to get the next page."
+            parts.append(f"\n**More results available.** Use page_token: `{result['nextPageToken']}` to get the next page.")
         
-        return output
+        return "".join(parts)
     except Exception as e:
         return f"Error listing task lists: {str(e)}. Please check your authentication and try again."
 
@@ -615,7 +1183,7 @@ async def list_task_lists(input: ListTaskListsInput) -> str:
 async def update_task_list(input: UpdateTaskListInput) -> str:
     """Update a task list"""
     try:
-        result = await tasks_client.update_tasklist(input.tasklist_id, input.title)
+        result = await get_client().update_tasklist(input.tasklist_id, input.title)
         return f"✅ Task list updated successfully!\n\n{ResponseFormatter.format_task_list(result, ResponseFormat.MARKDOWN)}"
     except Exception as e:
         return f"Error updating task list: {str(e)}. Please verify the task list ID and try again."
@@ -631,7 +1199,7 @@ async def update_task_list(input: UpdateTaskListInput) -> str:
 async def delete_task_list(input: DeleteTaskListInput) -> str:
     """Delete a task list"""
     try:
-        await tasks_client.delete_tasklist(input.tasklist_id)
+        await get_client().delete_tasklist(input.tasklist_id)
         return f"✅ Task list '{input.tasklist_id}' has been permanently deleted."
     except Exception as e:
         return f"Error deleting task list: {str(e)}. Please verify the task list ID and try again."
@@ -656,7 +1224,7 @@ async def delete_task_list(input: DeleteTaskListInput) -> str:
 async def create_task(input: CreateTaskInput) -> str:
     """Create a new task"""
     try:
-        result = await tasks_client.create_task(
+        result = await get_client().create_task(
             title=input.title,
             tasklist_id=input.tasklist_id,
             notes=input.notes,
@@ -686,7 +1254,7 @@ async def create_task(input: CreateTaskInput) -> str:
 async def list_tasks(input: ListTasksInput) -> str:
     """List tasks with filtering options"""
     try:
-        result = await tasks_client.list_tasks(
+        result = await get_client().list_tasks(
             tasklist_id=input.tasklist_id,
             max_results=input.max_results,
             show_completed=input.show_completed,
@@ -705,12 +1273,12 @@ async def list_tasks(input: ListTasksInput) -> str:
             return "No tasks found matching your criteria."
         
         title = f"Tasks from list '{input.tasklist_id}'"
-        output = ResponseFormatter.format_multiple_tasks(tasks, input.response_format, title)
+        parts = list(ResponseFormatter.iter_format_multiple_tasks(tasks, input.response_format, title))
         
         if result.get('nextPageToken'):
-            output += f"\n\n**More results available.** Use page_token: `{result['nextPageToken']}` to get the next page."
+            parts.append(f"\n\n**More results available.** Use page_token: `{result['nextPageToken']}` to get the next page.")
         
-        return output
+        return "".join(parts)
     except Exception as e:
         return f"Error listing tasks: {str(e)}. Please check your filters and try again."
 
@@ -728,23 +1296,23 @@ async def list_tasks(input: ListTasksInput) -> str:
 async def update_task(input: UpdateTaskInput) -> str:
     """Update a task"""
     try:
-        updates = {}
-        if input.title:
-            updates['title'] = input.title
-        if input.notes is not None:
-            updates['notes'] = input.notes
-        if input.status:
-            updates['status'] = input.status.value
-        if input.due_date:
-            updates['due_date'] = input.due_date
-        
-        result = await tasks_client.update_task(
+        # Empty values are dropped here or, for notes, by the client, so they leave the task unchanged
+        fields = (
+            ('title', input.title or None),
+            ('notes', input.notes),
+            ('status', input.status or None),
+            ('due_date', input.due_date or None),
+        )
+        updates = {key: value for key, value in fields if value is not None}
+        is_completed = input.status == TaskStatus.COMPLETED
+        
+        result = await get_client().update_task(
             task_id=input.task_id,
             tasklist_id=input.tasklist_id,
             **updates
         )
         
-        status_msg = "✅ completed" if input.status == TaskStatus.COMPLETED else "updated"
+        status_msg = "✅ completed" if is_completed else "updated"
         return f"Task {status_msg} successfully!\n\n{ResponseFormatter.format_task(result, ResponseFormat.DETAILED)}"
     except Exception as e:
         return f"Error updating task: {str(e)}. Please verify the task ID and try again."
@@ -759,7 +1327,7 @@ async def update_task(input: UpdateTaskInput) -> str:
 async def delete_task(input: DeleteTaskInput) -> str:
     """Delete a task"""
     try:
-        await tasks_client.delete_task(input.task_id, input.tasklist_id)
+        await get_client().delete_task(input.task_id, input.tasklist_id)
         return f"✅ Task '{input.task_id}' has been permanently deleted."
     except Exception as e:
         return f"Error deleting task: {str(e)}. Please verify the task ID and try again."
@@ -777,7 +1345,7 @@ async def delete_task(input: DeleteTaskInput) -> str:
 async def move_task(input: MoveTaskInput) -> str:
     """Move a task to a new position"""
     try:
-        result = await tasks_client.move_task(
+        result = await get_client().move_task(
             task_id=input.task_id,
             tasklist_id=input.tasklist_id,
             parent=input.parent_task_id,
@@ -800,7 +1368,7 @@ async def move_task(input: MoveTaskInput) -> str:
 async def clear_completed_tasks(input: ClearCompletedTasksInput) -> str:
     """Clear all completed tasks from a list"""
     try:
-        await tasks_client.clear_completed(input.tasklist_id)
+        await get_client().clear_completed(input.tasklist_id)
         return f"✅ All completed tasks have been cleared from task list '{input.tasklist_id}'."
     except Exception as e:
         return f"Error clearing completed tasks: {str(e)}. Please verify the task list ID and try again."
@@ -809,6 +1377,91 @@ async def clear_completed_tasks(input: ClearCompletedTasksInput) -> str:
 # WORKFLOW TOOLS
 # ==========================================
 
+# quick_add_task date keywords: keyword -> days from today
+_QUICK_ADD_KEYWORDS = {'tomorrow': 1, 'today': 0, 'next week': 7}
+_QUICK_ADD_KEYWORD_RE = re.compile(r'\b(?:tomorrow|today|next week)\b', re.IGNORECASE)
+
+# Date phrases specific enough to trust: relative keywords, full weekday names, month names
+# next to a day number and numeric dates with a year. Words that double as ordinary English
+# ('may', 'sat', 'sun', 'wed', 'march') and bare N/N fractions are deliberately left out.
+_MONTHS = (r'(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?'
+           r'|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)')
+_DAY_NUMBER = r'\d{1,2}(?:st|nd|rd|th)?'
+_DATE_TOKEN = (
+    r'(?:today|tonight|tomorrow|yesterday|next (?:week|month|year)'
+    r'|in \d+ (?:days?|weeks?|months?)'
+    r'|monday|tuesday|wednesday|thursday|friday|saturday|sunday|tues?|thu(?:rs?)?|fri'
+    rf'|{_MONTHS}\.? {_DAY_NUMBER}|{_DAY_NUMBER} (?:of )?{_MONTHS}'
+    r'|\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}/\d{2,4})'
+)
+# Cheap check for a date token, so dateparser only runs on text that may contain a date
+_DATE_GATE = re.compile(rf'\b{_DATE_TOKEN}\b', re.IGNORECASE)
+# A date phrase found by dateparser must be exactly one date token, optionally after a
+# connecting word; "today about 3/4/2025" contains tokens but is not itself a date
+_DATE_PHRASE_RE = re.compile(rf'(?:(?:on|by|due|the|this|next) )?{_DATE_TOKEN}', re.IGNORECASE)
+
+# Time of day after a date phrase ("tomorrow morning"); removed along with the phrase
+_TIME_OF_DAY_RE = re.compile(r'\s+(?:morning|afternoon|evening|night)\b', re.IGNORECASE)
+
+# Connecting words left dangling once the date phrase is removed (e.g. "next" in "next Friday")
+_DANGLING_DATE_WORD_RE = re.compile(r'\s*\b(?:next|on|by|due|for)$', re.IGNORECASE)
+
+# Optional natural-language date parsing, imported on first use: None until then, False if missing
+_dateparser = None
+
+def _load_dateparser():
+    """Import dateparser the first time a quick add needs it; returns None when it isn't installed"""
+    global _dateparser
+    if _dateparser is None:
+        try:
+            import dateparser
+            import dateparser.search
+            _dateparser = dateparser
+        except ImportError:
+            _dateparser = False
+    return _dateparser or None
+
+def _parse_quick_add(text: str) -> Tuple[str, Optional[str]]:
+    """Split quick-add text into a task title and an optional YYYY-MM-DD due date (CPU-bound)"""
+    dateparser = _load_dateparser() if _DATE_GATE.search(text) else None
+    if dateparser is not None:
+        settings = {'PREFER_DATES_FROM': 'future', 'RELATIVE_BASE': datetime.now()}
+        hits = dateparser.search.search_dates(text, languages=['en'], settings=settings) or []
+        
+        # Hits come back in text order, so each phrase is located after the previous one
+        spans = []
+        start = 0
+        for phrase, _ in hits:
+            start = text.find(phrase, start)
+            if start < 0:
+                break
+            spans.append((phrase, start, start + len(phrase)))
+            start += len(phrase)
+        
+        # dateparser also matches plain words ("may", "the march"), so only a phrase that is a
+        # date token as a whole is used. search_dates resolves relative phrases against earlier
+        # hits, so the accepted phrase is parsed again on its own for the due date.
+        for phrase, start, end in reversed(spans):
+            if not _DATE_PHRASE_RE.fullmatch(phrase):
+                continue
+            when = dateparser.parse(phrase, languages=['en'], settings=settings)
+            if when is None:
+                continue
+            time_of_day = _TIME_OF_DAY_RE.match(text, end)
+            if time_of_day:
+                end = time_of_day.end()
+            title = " ".join((text[:start] + " " + text[end:]).split())
+            return _DANGLING_DATE_WORD_RE.sub('', title), when.date().isoformat()
+    
+    # Keyword fallback when dateparser is not installed or finds nothing
+    # Whole words only, so "Tomorrowland tickets" or "Todays list" get no due date
+    keyword = _QUICK_ADD_KEYWORD_RE.search(text)
+    if keyword:
+        days = _QUICK_ADD_KEYWORDS[keyword.group(0).lower()]
+        due_date = (datetime.now().date() + timedelta(days=days)).isoformat()
+        return " ".join(_QUICK_ADD_KEYWORD_RE.sub('', text).split()), due_date
+    return text.strip(), None
+
 @mcp.tool(
     description="""Quickly add a task using natural language.
     
@@ -827,25 +1480,12 @@ async def clear_completed_tasks(input: ClearCompletedTasksInput) -> str:
 async def quick_add_task(input: QuickAddTaskInput) -> str:
     """Quickly add a task with smart parsing"""
     try:
-        # Simple parsing logic (can be enhanced with NLP)
-        text = input.text
-        due_date = None
-        
-        # Check for common date indicators
-        today = datetime.now().date()
-        if "tomorrow" in text.lower():
-            due_date = (today + timedelta(days=1)).isoformat()
-            text = text.lower().replace("tomorrow", "").strip()
-        elif "today" in text.lower():
-            due_date = today.isoformat()
-            text = text.lower().replace("today", "").strip()
-        elif "next week" in text.lower():
-            due_date = (today + timedelta(weeks=1)).isoformat()
-            text = text.lower().replace("next week", "").strip()
+        # dateparser is CPU-bound, so the text is parsed in a worker thread
+        title, due_date = await asyncio.to_thread(_parse_quick_add, input.text)
         
         # Create the task
-        result = await tasks_client.create_task(
-            title=text.strip(),
+        result = await get_client().create_task(
+            title=title,
             tasklist_id=input.tasklist_id,
             due=due_date
         )
@@ -854,6 +1494,32 @@ async def quick_add_task(input: QuickAddTaskInput) -> str:
     except Exception as e:
         return f"Error in quick add: {str(e)}"
 
+def _format_creation_results(title: str, created: List[Dict[str, Any]], failed: List[Tuple[str, Exception]]) -> str:
+    """Summarize the created and failed tasks of a batch creation"""
+    # Show the due date next to each title, so the dates picked for each task can be checked
+    created_tasks = [
+        f"{task.get('title', '')} (due {task['due'][:10]})" if task.get('due') else task.get('title', '')
+        for task in created
+    ]
+    failed_tasks = [f"{task_title}: {str(e)}" for task_title, e in failed]
+    
+    parts = [f"# {title}\n\n"]
+    parts.append(f"✅ **Successfully created:** {len(created_tasks)} tasks\n")
+    
+    if created_tasks:
+        parts.append("\n**Created tasks:**\n")
+        for task in itertools.islice(created_tasks, 10):  # Show first 10
+            parts.append(f"- {task}\n")
+        if len(created_tasks) > 10:
+            parts.append(f"... and {len(created_tasks) - 10} more\n")
+    
+    if failed_tasks:
+        parts.append(f"\n❌ **Failed:** {len(failed_tasks)} tasks\n")
+        for failure in itertools.islice(failed_tasks, 5):  # Show first 5 failures
+            parts.append(f"- {failure}\n")
+    
+    return "".join(parts)
+
 @mcp.tool(
     description="""Create multiple tasks at once efficiently.
     
@@ -869,39 +1535,38 @@ async def quick_add_task(input: QuickAddTaskInput) -> str:
 async def bulk_create_tasks(input: BulkCreateTasksInput) -> str:
     """Create multiple tasks in bulk"""
     try:
-        created_tasks = []
-        failed_tasks = []
-        
-        for task_title in input.tasks:
-            try:
-                result = await tasks_client.create_task(
-                    title=task_title,
-                    tasklist_id=input.tasklist_id,
-                    due=input.due_date
-                )
-                created_tasks.append(task_title)
-            except Exception as e:
-                failed_tasks.append(f"{task_title}: {str(e)}")
-        
-        output = f"# Bulk Task Creation Results\n\n"
-        output += f"✅ **Successfully created:** {len(created_tasks)} tasks\n"
-        
-        if created_tasks:
-            output += "\n**Created tasks:**\n"
-            for task in created_tasks[:10]:  # Show first 10
-                output += f"- {task}\n"
-            if len(created_tasks) > 10:
-                output += f"... and {len(created_tasks) - 10} more\n"
-        
-        if failed_tasks:
-            output += f"\n❌ **Failed:** {len(failed_tasks)} tasks\n"
-            for failure in failed_tasks[:5]:  # Show first 5 failures
-                output += f"- {failure}\n"
-        
-        return output
+        # Inserts are sent as batch requests, so the whole list costs one round trip per batch
+        created, failed = await get_client().batch_create_tasks(
+            [(task_title, input.due_date) for task_title in input.tasks],
+            tasklist_id=input.tasklist_id
+        )
+        return _format_creation_results("Bulk Task Creation Results", created, failed)
     except Exception as e:
         return f"Error in bulk creation: {str(e)}"
 
+@mcp.tool(
+    description="""Quickly add several tasks at once using natural language.
+    
+    Each text is parsed like quick_add_task (title plus an optional due date such
+    as "tomorrow" or "next week"), and all tasks are created together in a
+    single batch request instead of one call per task.
+    
+    Examples:
+    - ["Buy milk tomorrow", "Submit report next week", "Call the bank"]
+    
+    Returns: Summary of created tasks."""
+)
+async def quick_add_many(input: QuickAddManyInput) -> str:
+    """Quickly add several tasks with smart parsing"""
+    try:
+        # Parsing is local, so every task goes out in the same batch; dateparser is CPU-bound,
+        # so the texts are parsed in a worker thread rather than on the event loop
+        parsed = await asyncio.to_thread(lambda: [_parse_quick_add(text) for text in input.texts])
+        created, failed = await get_client().batch_create_tasks(parsed, tasklist_id=input.tasklist_id)
+        return _format_creation_results("Quick Add Results", created, failed)
+    except Exception as e:
+        return f"Error in quick add: {str(e)}"
+
 @mcp.tool(
     description="""Search for tasks across all task lists.
     
@@ -917,65 +1582,96 @@ async def bulk_create_tasks(input: BulkCreateTasksInput) -> str:
 async def search_tasks(input: SearchTasksInput) -> str:
     """Search tasks across all lists"""
     try:
-        # Get all task lists
-        lists_result = await tasks_client.list_tasklists(max_results=50)
+        client = get_client()
+        
+        # Get all task lists (repeated searches within CACHE_TTL are served from memory)
+        lists_result = await client.cached_list_tasklists(max_results=50)
         task_lists = lists_result.get('items', [])
         
-        matching_tasks = []
-        query_lower = input.query.lower()
+        pattern = re.compile(re.escape(input.query), re.IGNORECASE)
         
-        # Search through each task list
-        for task_list in task_lists:
-            try:
-                tasks_result = await tasks_client.list_tasks(
+        # Fetch the tasks of every list concurrently, a bounded number at a time
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        
+        async def scan(task_list):
+            """Collect up to max_results matches from one list, fetching further pages only while needed"""
+            matches = []
+            async with semaphore:
+                # Completed tasks and the date filters are applied by the API, not here
+                pages = client.iter_task_pages(
                     tasklist_id=task_list['id'],
-                    max_results=100,
-                    show_completed=input.include_completed
+                    max_results=MAX_TASKS_PER_RESPONSE,
+                    show_completed=input.include_completed,
+                    due_min=input.due_min,
+                    due_max=input.due_max,
+                    updated_min=input.updated_min
                 )
+                async for tasks_result in pages:
+                    for task in tasks_result.get('items', []):
+                        if pattern.search(task.get('title', '')) or pattern.search(task.get('notes', '')):
+                            matches.append(task)
+                            if len(matches) >= input.max_results:
+                                return matches
+            return matches
+        
+        fetches = [asyncio.create_task(scan(task_list)) for task_list in task_lists]
+        
+        matching_tasks = []
+        remaining = input.max_results
+        
+        # Take matches from each task list in order, as its scan completes
+        try:
+            for task_list, fetch in zip(task_lists, fetches):
+                try:
+                    matches = await fetch
+                except Exception as e:
+                    logger.warning(f"Error searching in list {task_list['id']}: {e}")
+                    continue
                 
-                tasks = tasks_result.get('items', [])
-                for task in tasks:
-                    title = task.get('title', '').lower()
-                    notes = task.get('notes', '').lower()
-                    
-                    if query_lower in title or query_lower in notes:
-                        task['_list_title'] = task_list['title']
-                        matching_tasks.append(task)
-                        
-                        if len(matching_tasks) >= input.max_results:
-                            break
-                
-                if len(matching_tasks) >= input.max_results:
+                # Pair each task with its list title rather than annotating it, since it is shared with the cache
+                list_title = task_list.get('title', 'Unknown List')
+                matching_tasks.extend((list_title, task) for task in itertools.islice(matches, remaining))
+                remaining = input.max_results - len(matching_tasks)
+                if remaining <= 0:
                     break
-                    
-            except Exception as e:
-                logger.warning(f"Error searching in list {task_list['id']}: {e}")
-                continue
+        finally:
+            # Stop fetching lists that are no longer needed
+            for fetch in fetches:
+                fetch.cancel()
+            await asyncio.gather(*fetches, return_exceptions=True)
         
         if not matching_tasks:
             return f"No tasks found matching '{input.query}'."
         
         # Format results
         if input.response_format == ResponseFormat.JSON:
-            return json.dumps(matching_tasks, indent=2)
+            return _dumps_pretty([{**task, '_list_title': list_title} for list_title, task in matching_tasks])
         
-        output = f"# Search Results for '{input.query}'\n\n"
-        output += f"Found {len(matching_tasks)} matching task(s)\n\n"
+        parts = [f"# Search Results for '{input.query}'\n\n"]
+        parts.append(f"Found {len(matching_tasks)} matching task(s)\n\n")
         
-        for task in matching_tasks:
-            list_title = task.pop('_list_title', 'Unknown List')
-            output += f"**List:** {list_title}\n"
-            output += ResponseFormatter.format_task(task, input.response_format)
-            output += "\n---\n\n"
+        for list_title, task in matching_tasks:
+            parts.append(f"**List:** {list_title}\n")
+            parts.append(ResponseFormatter.format_task_cached(task, input.response_format))
+            parts.append("\n---\n\n")
         
-        return output
+        return "".join(parts)
     except Exception as e:
         return f"Error searching tasks: {str(e)}"
 
+# get_task_summary time ranges: time_range -> (due_min date, due_max date, title)
+_SUMMARY_RANGES = {
+    'today': ('today', 'today', "Today's Tasks"),
+    'tomorrow': ('tomorrow', 'tomorrow', "Tomorrow's Tasks"),
+    'week': ('today', 'week_end', "This Week's Tasks"),
+    'overdue': (None, 'yesterday', "Overdue Tasks"),
+    'all': (None, None, "All Tasks"),
+}
+
 @mcp.tool(
     description="""Get a summary of tasks for a specific time range.
     
-    Provides an overview of:
+    Provides an overview across all task lists of:
     - Tasks due today
     - Tasks due tomorrow
     - Tasks for the week
@@ -990,67 +1686,95 @@ async def get_task_summary(input: GetTaskSummaryInput) -> str:
     """Get a summary of tasks by time range"""
     try:
         today = datetime.now().date()
-        filters = {}
+        dates = {
+            'today': today.isoformat(),
+            'tomorrow': (today + timedelta(days=1)).isoformat(),
+            'week_end': (today + timedelta(days=7)).isoformat(),
+            'yesterday': (today - timedelta(days=1)).isoformat(),
+        }
         
         # Set date filters based on time range
-        if input.time_range == "today":
-            filters['due_min'] = today.isoformat()
-            filters['due_max'] = today.isoformat()
-            title = "Today's Tasks"
-        elif input.time_range == "tomorrow":
-            tomorrow = today + timedelta(days=1)
-            filters['due_min'] = tomorrow.isoformat()
-            filters['due_max'] = tomorrow.isoformat()
-            title = "Tomorrow's Tasks"
-        elif input.time_range == "week":
-            week_end = today + timedelta(days=7)
-            filters['due_min'] = today.isoformat()
-            filters['due_max'] = week_end.isoformat()
-            title = "This Week's Tasks"
-        elif input.time_range == "overdue":
-            filters['due_max'] = (today - timedelta(days=1)).isoformat()
-            title = "Overdue Tasks"
-        else:  # all
-            title = "All Tasks"
-        
-        # Get tasks from default list (can be extended to all lists)
-        result = await tasks_client.list_tasks(
-            tasklist_id="@default",
-            max_results=50,
-            show_completed=input.include_completed,
-            **filters
-        )
+        due_min, due_max, title = _SUMMARY_RANGES[input.time_range]
+        filters = {}
+        if due_min:
+            filters['due_min'] = dates[due_min]
+        if due_max:
+            filters['due_max'] = dates[due_max]
         
-        tasks = result.get('items', [])
+        client = get_client()
+        lists_result = await client.cached_list_tasklists(max_results=50)
+        task_lists = lists_result.get('items', [])
+        
+        # Fetch the tasks of every list concurrently, a bounded number at a time
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        
+        async def collect(task_list):
+            """Read up to MAX_TASKS_PER_RESPONSE tasks from one list, and whether more remain"""
+            list_items = []
+            has_more = False
+            async with semaphore:
+                pages = client.iter_task_pages(
+                    tasklist_id=task_list['id'],
+                    max_results=50,
+                    show_completed=input.include_completed,
+                    **filters
+                )
+                async for result in pages:
+                    list_items.extend(result.get('items', []))
+                    has_more = bool(result.get('nextPageToken'))
+                    if len(list_items) >= MAX_TASKS_PER_RESPONSE:
+                        break
+            return list_items, has_more
+        
+        results = await asyncio.gather(*[collect(task_list) for task_list in task_lists], return_exceptions=True)
+        
+        # Merge the lists in order, up to MAX_TASKS_PER_RESPONSE tasks
+        tasks = []
+        has_more = False
+        for task_list, collected in zip(task_lists, results):
+            if isinstance(collected, Exception):
+                logger.warning(f"Error summarizing list {task_list['id']}: {collected}")
+                continue
+            list_items, list_has_more = collected
+            room = MAX_TASKS_PER_RESPONSE - len(tasks)
+            tasks.extend(itertools.islice(list_items, room))
+            has_more = has_more or list_has_more or len(list_items) > room
         
         if not tasks:
             return f"No tasks found for {title.lower()}."
         
+        # Serialize JSON in one pass rather than concatenating per-task documents
+        if input.response_format == ResponseFormat.JSON:
+            return _dumps_pretty(tasks)
+        
         # Organize tasks by status
-        pending_tasks = [t for t in tasks if t.get('status') != 'completed']
-        completed_tasks = [t for t in tasks if t.get('status') == 'completed']
+        pending_tasks, completed_tasks = [], []
+        for t in tasks:
+            (completed_tasks if t.get('status') == 'completed' else pending_tasks).append(t)
         
         # Format output
-        output = f"# {title}\n\n"
-        output += f"**Summary:** {len(pending_tasks)} pending"
+        parts = [f"# {title}\n\n"]
+        parts.append(f"**Summary:** {len(pending_tasks)} pending")
         if input.include_completed:
-            output += f", {len(completed_tasks)} completed"
-        output += "\n\n"
+            parts.append(f", {len(completed_tasks)} completed")
+        parts.append("\n\n")
         
         if pending_tasks:
-            output += "## ⏳ Pending Tasks\n\n"
-            for task in pending_tasks[:20]:  # Limit to prevent huge responses
-                output += ResponseFormatter.format_task(task, input.response_format) + "\n"
+            parts.append("## ⏳ Pending Tasks\n\n")
+            for task in itertools.islice(pending_tasks, 20):  # Limit to prevent huge responses
+                parts.append(ResponseFormatter.format_task_cached(task, input.response_format))
+                parts.append("\n")
         
         if input.include_completed and completed_tasks:
-            output += "\n## ✅ Completed Tasks\n\n"
-            for task in completed_tasks[:10]:
-                output += ResponseFormatter.format_task(task, input.response_format) + "\n"
+            parts.append("\n## ✅ Completed Tasks\n\n")
+            for task in itertools.islice(completed_tasks, 10):
+                parts.append(ResponseFormatter.format_task_cached(task, input.response_format))
+                parts.append("\n")
         
-        if result.get('nextPageToken'):
-            output += f"\n**Note:** More tasks available. This is a summary of the first {len(tasks)} tasks."
+        if has_more:
+            parts.append(f"\n**Note:** More tasks available. This is a summary of the first {len(tasks)} tasks.")
         
-        return output
+        return "".join(parts)
     except Exception as e:
         return f"Error getting task summary: {str(e)}"
 
@@ -1078,6 +1802,16 @@ Once complete, run this server again.
         """, file=sys.stderr)
         sys.exit(1)
     
+    # Authenticate before serving so a first-run OAuth flow doesn't happen inside a tool call
+    get_client()
+    
+    # Use uvloop's faster event loop when it is installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     # Start the server
     # Support both stdio (local) and HTTP/SSE (remote) modes via env vars
     mode = os.getenv("MCP_MODE", "stdio").lower()
@@ -28,22 +28,28 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
+# Message templates, built once so each print is a single format and write
+_HEADER_RULE = f"{Colors.HEADER}{Colors.BOLD}{'='*60}{Colors.ENDC}"
+_HEADER_TMPL = f"\n{_HEADER_RULE}\n{Colors.HEADER}{Colors.BOLD}{{:^60}}{Colors.ENDC}\n{_HEADER_RULE}\n\n"
+_SUCCESS_TMPL = f"{Colors.OKGREEN}✅ {{}}{Colors.ENDC}{{}}"
+_WARNING_TMPL = f"{Colors.WARNING}⚠️  {{}}{Colors.ENDC}{{}}"
+_ERROR_TMPL = f"{Colors.FAIL}❌ {{}}{Colors.ENDC}{{}}"
+_INFO_TMPL = f"{Colors.OKCYAN}ℹ️  {{}}{Colors.ENDC}{{}}"
+
 def print_header(text):
-    print(f"\n{Colors.HEADER}{Colors.BOLD}{'='*60}{Colors.ENDC}")
-    print(f"{Colors.HEADER}{Colors.BOLD}{text:^60}{Colors.ENDC}")
-    print(f"{Colors.HEADER}{Colors.BOLD}{'='*60}{Colors.ENDC}\n")
+    sys.stdout.write(_HEADER_TMPL.format(text))
 
-def print_success(text):
-    print(f"{Colors.OKGREEN}✅ {text}{Colors.ENDC}")
+def print_success(text, end="\n"):
+    sys.stdout.write(_SUCCESS_TMPL.format(text, end))
 
-def print_warning(text):
-    print(f"{Colors.WARNING}⚠️  {text}{Colors.ENDC}")
+def print_warning(text, end="\n"):
+    sys.stdout.write(_WARNING_TMPL.format(text, end))
 
-def print_error(text):
-    print(f"{Colors.FAIL}❌ {text}{Colors.ENDC}")
+def print_error(text, end="\n"):
+    sys.stdout.write(_ERROR_TMPL.format(text, end))
 
-def print_info(text):
-    print(f"{Colors.OKCYAN}ℹ️  {text}{Colors.ENDC}")
+def print_info(text, end="\n"):
+    sys.stdout.write(_INFO_TMPL.format(text, end))
 
 def check_python_version():
     """Check if Python version is 3.8 or higher"""
@@ -60,8 +66,11 @@ def install_dependencies():
     """Install required Python packages"""
     print_header("Installing Dependencies")
     
+    # Prefer prebuilt wheels and skip byte-compiling; pip's own cache is reused between runs
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+        subprocess.check_call(
+            [sys.executable, "-m", "pip", "install", "--prefer-binary", "--no-compile", "-r", "requirements.txt"]
+        )
         print_success("All dependencies installed successfully")
         return True
     except subprocess.CalledProcessError:
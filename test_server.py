@@ -5,15 +5,24 @@ Test script for Google Tasks MCP Server
 This script runs basic tests to verify the MCP server is working correctly.
 """
 
+import os
+import sys
 import json
 import asyncio
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
-from google_tasks_mcp import (
-    GoogleTasksClient,
-    ResponseFormatter,
-    ResponseFormat,
-    TaskStatus
-)
+
+def _import_server():
+    """Import the server module on first use, so importing this script stays cheap"""
+    global GoogleTasksClient, ResponseFormatter, ResponseFormat, TaskStatus, _parse_quick_add, _load_dateparser
+    from google_tasks_mcp import (
+        GoogleTasksClient,
+        ResponseFormatter,
+        ResponseFormat,
+        TaskStatus,
+        _parse_quick_add,
+        _load_dateparser
+    )
 
 class Colors:
     OKGREEN = '\033[92m'
@@ -22,206 +31,311 @@ class Colors:
     ENDC = '\033[0m'
     BOLD = '\033[1m'
 
-def print_test(name):
-    print(f"\n{Colors.BOLD}Testing: {name}{Colors.ENDC}")
+# Sample task data for the formatting test, built once at import
+SAMPLE_TASK = {
+    'id': 'test123',
+    'title': 'Sample Task',
+    'notes': 'This is a test note',
+    'status': 'needsAction',
+    'due': '2024-12-25T00:00:00.000Z'
+}
 
-def print_success(msg):
-    print(f"{Colors.OKGREEN}✓ {msg}{Colors.ENDC}")
+# Quick-add parsing cases: text -> (expected title, expected due date). A due of True
+# means "some date" (weekday and month phrases depend on today); None means no due date.
+# Cases that need dateparser are flagged, since only the keyword fallback runs without it.
+_TODAY = datetime.now().date()
+QUICK_ADD_CASES = [
+    # (text, title, due, needs dateparser)
+    ("Buy milk tomorrow", "Buy milk", (_TODAY + timedelta(days=1)).isoformat(), False),
+    ("Buy milk tomorrow morning", "Buy milk", (_TODAY + timedelta(days=1)).isoformat(), True),
+    ("Meeting with John next Friday", "Meeting with John", True, True),
+    ("Call mom in 3 days", "Call mom", (_TODAY + timedelta(days=3)).isoformat(), True),
+    ("Pay rent Jan 15", "Pay rent", True, True),
+    ("Submit report on 2026-11-03", "Submit report", "2026-11-03", True),
+    ("Urgent: Fix bug in login system", "Urgent: Fix bug in login system", None, False),
+    # Ordinary words and fractions that dateparser would otherwise read as dates
+    ("I may call Bob", "I may call Bob", None, False),
+    ("Sat down with team", "Sat down with team", None, False),
+    ("Check the 3/4 inch bolts", "Check the 3/4 inch bolts", None, False),
+    ("Write the march report", "Write the march report", None, False),
+    ("Email sun team", "Email sun team", None, False),
+    ("Tomorrowland tickets", "Tomorrowland tickets", None, False),
+    ("Todays list", "Todays list", None, False),
+    # A real date alongside those words; the due date comes from the real date alone
+    ("I may call Bob tomorrow", "I may call Bob", (_TODAY + timedelta(days=1)).isoformat(), True),
+    ("Sat down with team tomorrow", "Sat down with team", (_TODAY + timedelta(days=1)).isoformat(), True),
+    ("Check the 3/4 inch bolts tomorrow", "Check the 3/4 inch bolts", (_TODAY + timedelta(days=1)).isoformat(), True),
+    ("Friday review prep for Friday", "Friday review prep", True, True),
+    ("Call today about 3/4/2025 report", "Call about 3/4/2025 report", _TODAY.isoformat(), False),
+]
 
-def print_fail(msg):
-    print(f"{Colors.FAIL}✗ {msg}{Colors.ENDC}")
+# Colored line templates, built once
+_TEST_TMPL = f"\n{Colors.BOLD}Testing: %s{Colors.ENDC}"
+_SUCCESS_TMPL = f"{Colors.OKGREEN}✓ %s{Colors.ENDC}"
+_FAIL_TMPL = f"{Colors.FAIL}✗ %s{Colors.ENDC}"
+_WARNING_TMPL = f"{Colors.WARNING}⚠ %s{Colors.ENDC}"
 
-def print_warning(msg):
-    print(f"{Colors.WARNING}⚠ {msg}{Colors.ENDC}")
+class TestLog:
+    """Buffered output of one test, written in a single call once the test is done"""
+    __test__ = False  # not a pytest test class
+    
+    def __init__(self, name):
+        self._lines = [_TEST_TMPL % (name,)]
+    
+    def success(self, msg):
+        self._lines.append(_SUCCESS_TMPL % (msg,))
+    
+    def fail(self, msg):
+        self._lines.append(_FAIL_TMPL % (msg,))
+    
+    def warning(self, msg):
+        self._lines.append(_WARNING_TMPL % (msg,))
+    
+    def __str__(self):
+        return "\n".join(self._lines) + "\n"
 
 async def test_authentication():
     """Test authentication with Google Tasks"""
-    print_test("Authentication")
+    log = TestLog("Authentication")
     try:
-        client = GoogleTasksClient()
-        print_success("Successfully authenticated with Google Tasks API")
+        # Loading (and possibly refreshing) credentials blocks, so keep it off the event loop
+        client = await asyncio.to_thread(GoogleTasksClient)
+        log.success("Successfully authenticated with Google Tasks API")
         return client
     except Exception as e:
-        print_fail(f"Authentication failed: {e}")
+        log.fail(f"Authentication failed: {e}")
         return None
+    finally:
+        sys.stdout.write(str(log))
+
+@asynccontextmanager
+async def _ephemeral(create, delete, log, label):
+    """Create a resource for the duration of the block, deleting it exactly once afterwards
+    
+    `create` is awaited for the resource; `delete` is given its ID on the way out.
+    """
+    resource = await create
+    completed = False
+    try:
+        yield resource
+        completed = True
+    finally:
+        # The delete also runs when the block is cancelled (e.g. by Ctrl-C), so nothing is left behind
+        if completed:
+            await delete(resource['id'])
+        else:
+            # Best-effort cleanup; the original error is what gets reported
+            try:
+                await delete(resource['id'])
+                log.warning(f"Cleaned up test {label} after error")
+            except Exception:
+                pass
 
-async def test_list_operations(client):
+async def test_list_operations(client, timestamp):
     """Test task list operations"""
-    print_test("Task List Operations")
-    test_list_id = None
+    log = TestLog("Task List Operations")
     
     try:
-        # Test listing task lists
-        result = await client.list_tasklists(max_results=5)
+        # Test listing task lists, before the test list exists so it is never in the count
+        result = await client.list_tasklists(max_results=5, fields='items(id,title)')
         lists = result.get('items', [])
-        print_success(f"Found {len(lists)} task list(s)")
+        log.success(f"Found {len(lists)} task list(s)")
         
-        # Test creating a task list
-        test_list_title = f"MCP Test List {datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        new_list = await client.create_tasklist(test_list_title)
-        test_list_id = new_list['id']
-        print_success(f"Created test list: {new_list['title']}")
-        
-        # Test updating the task list
-        updated_title = f"{test_list_title} - Updated"
-        updated_list = await client.update_tasklist(test_list_id, updated_title)
-        print_success(f"Updated test list title to: {updated_list['title']}")
-        
-        # Clean up - delete test list
-        await client.delete_tasklist(test_list_id)
-        print_success("Cleaned up test list")
+        test_list_title = f"MCP Test List {timestamp}"
+        async with _ephemeral(
+            client.create_tasklist(test_list_title, fields='id,title'),
+            client.delete_tasklist, log, "list"
+        ) as new_list:
+            log.success(f"Created test list: {new_list['title']}")
+            
+            # Test updating the task list
+            updated_title = f"{test_list_title} - Updated"
+            updated_list = await client.update_tasklist(new_list['id'], updated_title)
+            log.success(f"Updated test list title to: {updated_list['title']}")
+        log.success("Cleaned up test list")
         
-        return True
+        return True, log
         
     except Exception as e:
-        print_fail(f"Task list operations failed: {e}")
-        # Try to clean up if test list was created
-        if test_list_id:
-            try:
-                await client.delete_tasklist(test_list_id)
-                print_warning("Cleaned up test list after error")
-            except:
-                pass
-        return False
+        log.fail(f"Task list operations failed: {e}")
+        return False, log
 
-async def test_task_operations(client):
+async def test_task_operations(client, time_of_day, tomorrow):
     """Test task operations"""
-    print_test("Task Operations")
-    test_task_id = None
+    log = TestLog("Task Operations")
     
     try:
         # Create a test task
-        task_title = f"MCP Test Task {datetime.now().strftime('%H:%M:%S')}"
-        tomorrow = (datetime.now() + timedelta(days=1)).date().isoformat()
-        
-        new_task = await client.create_task(
-            title=task_title,
-            notes="This is a test task created by MCP test script",
-            due=tomorrow
-        )
-        test_task_id = new_task['id']
-        print_success(f"Created test task: {new_task['title']}")
-        
-        # List tasks
-        tasks_result = await client.list_tasks(max_results=10)
-        tasks = tasks_result.get('items', [])
-        print_success(f"Listed {len(tasks)} task(s)")
-        
-        # Update the task
-        updated_task = await client.update_task(
-            task_id=test_task_id,
-            title=f"{task_title} - Updated",
-            status=TaskStatus.COMPLETED.value
-        )
-        print_success(f"Updated test task and marked as completed")
-        
-        # Delete the test task
-        await client.delete_task(test_task_id)
-        print_success("Deleted test task")
+        task_title = f"MCP Test Task {time_of_day}"
+        async with _ephemeral(
+            client.create_task(
+                title=task_title,
+                notes="This is a test task created by MCP test script",
+                due=tomorrow,
+                fields='id,title'
+            ),
+            client.delete_task, log, "task"
+        ) as new_task:
+            log.success(f"Created test task: {new_task['title']}")
+            # List only once the create has returned, so the count always includes the new task
+            tasks_result = await client.list_tasks(max_results=10, fields='items(id,title)')
+            tasks = tasks_result.get('items', [])
+            log.success(f"Listed {len(tasks)} task(s)")
+            
+            # Update the task
+            updated_task = await client.update_task(
+                task_id=new_task['id'],
+                title=f"{task_title} - Updated",
+                status=TaskStatus.COMPLETED.value
+            )
+            log.success(f"Updated test task and marked as completed")
+        log.success("Deleted test task")
         
-        return True
+        return True, log
         
     except Exception as e:
-        print_fail(f"Task operations failed: {e}")
-        # Try to clean up if test task was created
-        if test_task_id:
-            try:
-                await client.delete_task(test_task_id)
-                print_warning("Cleaned up test task after error")
-            except:
-                pass
-        return False
+        log.fail(f"Task operations failed: {e}")
+        return False, log
 
 async def test_response_formatting():
     """Test response formatting"""
-    print_test("Response Formatting")
+    log = TestLog("Response Formatting")
     
     try:
-        # Create sample task data
-        sample_task = {
-            'id': 'test123',
-            'title': 'Sample Task',
-            'notes': 'This is a test note',
-            'status': 'needsAction',
-            'due': '2024-12-25T00:00:00.000Z'
-        }
+        sample_task = SAMPLE_TASK
         
-        # Test different formats
-        formats_tested = []
-        
-        for format_type in [ResponseFormat.JSON, ResponseFormat.MARKDOWN, 
-                           ResponseFormat.CONCISE, ResponseFormat.DETAILED]:
-            formatted = ResponseFormatter.format_task(sample_task, format_type)
-            if formatted:
-                formats_tested.append(format_type.value)
+        # Test different formats, plus multiple tasks formatting, in worker threads
+        # so the event loop stays free for the API tests running alongside
+        format_types = [ResponseFormat.JSON, ResponseFormat.MARKDOWN,
+                        ResponseFormat.CONCISE, ResponseFormat.DETAILED]
+        sample_tasks = [sample_task] * 2  # the formatter only reads the tasks
+        *formatted, formatted_multiple = await asyncio.gather(
+            *[asyncio.to_thread(ResponseFormatter.format_task, sample_task, format_type)
+              for format_type in format_types],
+            asyncio.to_thread(
+                ResponseFormatter.format_multiple_tasks,
+                sample_tasks,
+                ResponseFormat.MARKDOWN,
+                "Test Tasks"
+            )
+        )
         
-        print_success(f"Tested formats: {', '.join(formats_tested)}")
+        formats_tested = [format_type.value for format_type, output in zip(format_types, formatted) if output]
+        log.success(f"Tested formats: {', '.join(formats_tested)}")
         
-        # Test multiple tasks formatting
-        sample_tasks = [sample_task, sample_task.copy()]
-        formatted_multiple = ResponseFormatter.format_multiple_tasks(
-            sample_tasks, 
-            ResponseFormat.MARKDOWN,
-            "Test Tasks"
-        )
+        # JSON output must decode back to the original task
+        if json.loads(formatted[0]) != sample_task:
+            raise ValueError("JSON output does not round-trip to the original task")
+        log.success("JSON output round-trips")
         
         if formatted_multiple:
-            print_success("Multiple task formatting works")
+            log.success("Multiple task formatting works")
         
-        return True
+        return True, log
         
     except Exception as e:
-        print_fail(f"Response formatting failed: {e}")
-        return False
+        log.fail(f"Response formatting failed: {e}")
+        return False, log
+
+async def test_quick_add_parsing():
+    """Test quick-add title and due date parsing against the case table"""
+    log = TestLog("Quick Add Parsing")
+    
+    # dateparser is slow to import and to run, so load it and parse in worker threads
+    has_dateparser = await asyncio.to_thread(_load_dateparser) is not None
+    cases = [case for case in QUICK_ADD_CASES if has_dateparser or not case[3]]
+    skipped = len(QUICK_ADD_CASES) - len(cases)
+    parsed = await asyncio.to_thread(lambda: [_parse_quick_add(case[0]) for case in cases])
+    
+    mismatches = []
+    for (text, title, due, _), (got_title, got_due) in zip(cases, parsed):
+        due_ok = got_due is not None if due is True else got_due == due
+        if got_title != title or not due_ok:
+            mismatches.append(f"{text!r} -> ({got_title!r}, {got_due!r})")
+    
+    if skipped:
+        log.warning(f"Skipped {skipped} case(s) that need dateparser")
+    if mismatches:
+        log.fail(f"Unexpected parses: {'; '.join(mismatches)}")
+        return False, log
+    log.success(f"Parsed {len(cases)} quick-add case(s) as expected")
+    return True, log
 
 async def test_search_functionality(client):
     """Test search across task lists"""
-    print_test("Search Functionality")
+    log = TestLog("Search Functionality")
     
     try:
         # This is a basic connectivity test
         # In production, you'd search for actual tasks
         lists_result = await client.list_tasklists(max_results=1)
         if lists_result:
-            print_success("Search infrastructure is accessible")
-            return True
+            log.success("Search infrastructure is accessible")
+            return True, log
         else:
-            print_warning("No task lists found for search test")
-            return True
+            log.warning("No task lists found for search test")
+            return True, log
             
     except Exception as e:
-        print_fail(f"Search test failed: {e}")
-        return False
+        log.fail(f"Search test failed: {e}")
+        return False, log
 
 async def main():
     """Run all tests"""
+    # Import the server's Google client stack in a worker thread while the banner prints
+    server_import = asyncio.get_running_loop().run_in_executor(None, _import_server)
+    
     print(f"\n{Colors.BOLD}{'='*60}")
     print("Google Tasks MCP Server Test Suite")
     print(f"{'='*60}{Colors.ENDC}")
     
-    # Test authentication first
+    await server_import
+    
+    # Test authentication first, formatting the sample tasks (no API calls) meanwhile
+    formatting = asyncio.create_task(test_response_formatting())
     client = await test_authentication()
     if not client:
+        formatting.cancel()
+        await asyncio.gather(formatting, return_exceptions=True)
         print(f"\n{Colors.FAIL}Cannot proceed without authentication{Colors.ENDC}")
         return False
     
-    # Run tests
-    results = []
+    # Names and due dates for the test list and task, computed once for the run
+    now = datetime.now()
+    timestamp = now.strftime('%Y%m%d_%H%M%S')
+    time_of_day = now.strftime('%H:%M:%S')
+    tomorrow = (now + timedelta(days=1)).date().isoformat()
     
-    # Test response formatting (doesn't need API calls)
-    results.append(await test_response_formatting())
+    # Run tests concurrently; they share only the client and its connection pool
+    async with client:
+        outcomes = await asyncio.gather(
+            formatting,
+            test_quick_add_parsing(),
+            test_list_operations(client, timestamp),
+            test_task_operations(client, time_of_day, tomorrow),
+            test_search_functionality(client),
+            return_exceptions=True
+        )
     
-    # Test API operations
-    results.append(await test_list_operations(client))
-    results.append(await test_task_operations(client))
-    results.append(await test_search_functionality(client))
+    # Write each test's buffered output in order, now that none are still running
+    results = []
+    logs = []
+    for outcome in outcomes:
+        if isinstance(outcome, Exception):
+            results.append(False)
+            logs.append("\n%s\n" % (_FAIL_TMPL % (f"Test crashed: {outcome}",)))
+        else:
+            ok, log = outcome
+            results.append(ok)
+            logs.append(str(log))
+    sys.stdout.write("".join(logs))
     
     # Summary
     print(f"\n{Colors.BOLD}{'='*60}")
     print("Test Summary")
     print(f"{'='*60}{Colors.ENDC}")
     
-    passed = sum(1 for r in results if r)
+    passed = sum(results)  # results are bools
     total = len(results)
     
     if passed == total:
@@ -239,10 +353,14 @@ async def main():
 if __name__ == "__main__":
     try:
         success = asyncio.run(main())
-        exit(0 if success else 1)
     except KeyboardInterrupt:
         print("\n\nTest interrupted by user")
-        exit(1)
+        sys.exit(1)
     except Exception as e:
         print(f"\n{Colors.FAIL}Unexpected error: {e}{Colors.ENDC}")
-        exit(1)
+        sys.exit(1)
+    
+    # Everything is already cleaned up, so skip interpreter teardown
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(0 if success else 1)